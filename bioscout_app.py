@@ -1,39 +1,235 @@
 import streamlit as st
-import pandas as pd
 import os
+import io
+import csv
 import glob
+import shutil
 import uuid
 import datetime
+from collections import Counter
+from functools import lru_cache
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends go unlocked
+    fcntl = None
 
 ##############################
 # --- Config/Constants
 OBS_CSV_PATH = "data/observations.csv"
+OBS_PARQUET_PATH = "data/observations.parquet"
+# Once the CSV append log grows past this, it is folded into the Parquet base
+OBS_COMPACT_BYTES = 1 << 20
+# Rows per chunk when streaming the store, and rows shown in the table widget
+OBS_CHUNK_ROWS = 10_000
+OBS_DISPLAY_ROWS = 1_000
 KB_DIR = "data/kb_snippets"
+OBS_COLUMNS = [
+    "observation_id", "species_name", "common_name", "date_observed",
+    "location", "image_url", "notes", "submitted_by"
+]
+OBS_SEARCH_COLUMNS = ["species_name", "common_name", "notes", "location"]
+RAG_TOP_K = 5
+# Ranked hits are drawn from a wider candidate pool and thinned by MMR
+RAG_CANDIDATES = 20
+MMR_LAMBDA = 0.5
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+# Cosine similarity below which a KB snippet is not considered a semantic match
+EMBEDDING_MIN_SCORE = 0.3
+# Every column is free text; a fixed schema skips pandas' per-column inference
+# and, with NA detection off, empty cells stay empty strings
+OBS_DTYPES = {col: "string" for col in OBS_COLUMNS}
+OBS_CSV_OPTIONS = dict(dtype=OBS_DTYPES, engine="c", na_filter=False, keep_default_na=False)
 
 ##############################
 # --- Helper Functions
+# pandas, numpy and pyarrow are imported inside the helpers that use them, so
+# the page shell renders before their import cost is paid
+
+@lru_cache(maxsize=None)
+def obs_schema():
+    import pyarrow as pa
+    return pa.schema([(col, pa.string()) for col in OBS_COLUMNS])
+
+def stat_key(stat):
+    # Every write grows or truncates the log, so its size changes even when two
+    # appends land within one tick of the filesystem clock
+    return stat.st_mtime_ns, stat.st_size
 
-def load_observations():
-    if not os.path.exists(OBS_CSV_PATH):
-        # Create a starter CSV if not present
-        df = pd.DataFrame(columns=[
-            "observation_id", "species_name", "common_name", "date_observed",
-            "location", "image_url", "notes", "submitted_by"
-        ])
-        df.to_csv(OBS_CSV_PATH, index=False)
-    return pd.read_csv(OBS_CSV_PATH)
+def obs_file_key():
+    if not os.path.exists(OBS_CSV_PATH) or os.path.getsize(OBS_CSV_PATH) == 0:
+        # Create a starter CSV if not present; a log left empty by an
+        # interrupted compaction gets its header back the same way
+        with open(OBS_CSV_PATH, "a", newline="", encoding="utf-8") as f:
+            lock_file(f, exclusive=True)
+            if os.fstat(f.fileno()).st_size == 0:
+                csv.writer(f, lineterminator="\n").writerow(OBS_COLUMNS)
+    return stat_key(os.stat(OBS_CSV_PATH))
+
+def lock_file(f, exclusive=False):
+    # Advisory lock shared by all Streamlit sessions, released when `f` closes
+    if fcntl:
+        fcntl.flock(f, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+
+def compacted_log_rows(log):
+    # Rows at the head of the CSV log that the Parquet base already holds.
+    # Normally 0: only a compaction that died between replacing the base and
+    # truncating the log leaves such a prefix behind. The base records the
+    # size, row count and last observation_id of the log it absorbed, which
+    # identifies that prefix until the next compaction clears it.
+    import pandas as pd
+    import pyarrow.parquet as pq
+    if not os.path.exists(OBS_PARQUET_PATH):
+        return 0
+    meta = pq.read_schema(OBS_PARQUET_PATH).metadata or {}
+    n_rows = int(meta.get(b"log_rows", b"0"))
+    if not n_rows or os.fstat(log.fileno()).st_size < int(meta[b"log_bytes"]):
+        return 0
+    log.seek(0)
+    ids = pd.read_csv(log, usecols=["observation_id"], nrows=n_rows, **OBS_CSV_OPTIONS)["observation_id"]
+    if len(ids) == n_rows and ids.iloc[-1] == meta[b"log_last_id"].decode("utf-8"):
+        return n_rows
+    return 0
+
+def read_observations(log):
+    # Observations live in a compacted Parquet base plus the CSV append log;
+    # `log` is the open, locked CSV file
+    import pandas as pd
+    if os.fstat(log.fileno()).st_size == 0:
+        # Header lost to an interrupted compaction: the log holds no rows
+        recent = pd.DataFrame(columns=OBS_COLUMNS).astype(OBS_DTYPES)
+    else:
+        stale_rows = compacted_log_rows(log)
+        log.seek(0)
+        recent = pd.read_csv(log, skiprows=range(1, stale_rows + 1), **OBS_CSV_OPTIONS)
+    if not os.path.exists(OBS_PARQUET_PATH):
+        return recent
+    base = pd.read_parquet(OBS_PARQUET_PATH, engine="pyarrow").astype(OBS_DTYPES)
+    return pd.concat([base, recent], ignore_index=True)
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def load_observations(file_key):
+    # `file_key` is only the cache key and may already be stale: the frame is
+    # returned with the key of the file as it was read, under the lock
+    with open(OBS_CSV_PATH, "r", newline="", encoding="utf-8") as log:
+        lock_file(log)
+        return stat_key(os.fstat(log.fileno())), read_observations(log)
+
+def session_observations():
+    # Each session keeps its own handle on the frame, so reruns skip
+    # st.cache_data's per-call copy; the handle is refreshed once the file has
+    # changed, whether through save_observation here or another session.
+    # The returned key always describes exactly this frame, which is what the
+    # shared search indexes are keyed on.
+    file_key = obs_file_key()
+    if st.session_state.get("obs_key") != file_key:
+        st.session_state.obs_key, st.session_state.obs_df = load_observations(file_key)
+    return st.session_state.obs_df, st.session_state.obs_key
+
+def compact_observations(log):
+    # Stream the Parquet base and then the CSV log into a new Parquet base one
+    # chunk at a time, so memory stays bounded by OBS_CHUNK_ROWS however large
+    # the store grows, and truncate the log back to its header. The caller
+    # holds the exclusive lock.
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    log.flush()
+    stale_rows = compacted_log_rows(log)
+    skip = range(1, stale_rows + 1)
+    log.seek(0)
+    ids = pd.read_csv(log, usecols=["observation_id"], skiprows=skip, **OBS_CSV_OPTIONS)["observation_id"]
+    # Describe the whole log as it stands, so a crash before the truncate
+    # below leaves a prefix that compacted_log_rows can recognise
+    schema = obs_schema().with_metadata({
+        "log_bytes": str(os.fstat(log.fileno()).st_size),
+        "log_rows": str(stale_rows + len(ids)),
+        "log_last_id": ids.iloc[-1] if len(ids) else "",
+    })
+    log.seek(0)
+    tmp_path = OBS_PARQUET_PATH + ".tmp"
+    try:
+        with pq.ParquetWriter(tmp_path, schema) as writer:
+            if os.path.exists(OBS_PARQUET_PATH):
+                for batch in pq.ParquetFile(OBS_PARQUET_PATH).iter_batches(batch_size=OBS_CHUNK_ROWS):
+                    writer.write_table(pa.Table.from_batches([batch]).cast(obs_schema()))
+            for chunk in pd.read_csv(log, skiprows=skip, chunksize=OBS_CHUNK_ROWS, **OBS_CSV_OPTIONS):
+                writer.write_table(pa.Table.from_pandas(chunk, schema=obs_schema(), preserve_index=False))
+        os.replace(tmp_path, OBS_PARQUET_PATH)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    log.truncate(0)
+    csv.DictWriter(log, fieldnames=OBS_COLUMNS, lineterminator="\n").writeheader()
+    # Get the header to disk now, while a failure still lands in the caller's
+    # error handling, rather than when the caller closes the log
+    log.flush()
+    os.fsync(log.fileno())
 
 def save_observation(row):
-    df = load_observations()
-    df = pd.concat([df, pd.DataFrame([row])], ignore_index=True)
-    df.to_csv(OBS_CSV_PATH, index=False)
+    # Append the single new row instead of rewriting the whole file
+    with open(OBS_CSV_PATH, "a+", newline="", encoding="utf-8") as f:
+        lock_file(f, exclusive=True)
+        writer = csv.DictWriter(f, fieldnames=OBS_COLUMNS, lineterminator="\n")
+        if os.path.getsize(OBS_CSV_PATH) == 0:
+            writer.writeheader()
+        else:
+            with open(OBS_CSV_PATH, "rb") as tail:
+                tail.seek(-1, os.SEEK_END)
+                if tail.read(1) != b"\n":
+                    f.write("\n")
+        writer.writerow(row)
+        f.flush()
+        if os.path.getsize(OBS_CSV_PATH) > OBS_COMPACT_BYTES:
+            try:
+                compact_observations(f)
+            except (OSError, ValueError):
+                # The row is already safe in the log; the next submission
+                # retries the compaction
+                pass
+    load_observations.clear()
+    if "observer_counter" in st.session_state:
+        st.session_state.observer_counter[row["submitted_by"]] += 1
+        st.session_state.observer_rows += 1
 
-def get_kb_snippets():
+def kb_files_key():
+    return tuple(sorted((fname, os.path.getmtime(fname)) for fname in glob.iglob(f"{KB_DIR}/*.txt")))
+
+def pack_lower(snippets):
+    # Every lowercased snippet in one NUL-separated UTF-8 buffer, plus the
+    # offset at which each one starts
+    import numpy as np
+    parts = [s.lower().encode("utf-8") for s in snippets]
+    starts = np.cumsum([0] + [len(p) + 1 for p in parts[:-1]], dtype=np.int64) if parts else np.empty(0, np.int64)
+    return b"\0".join(parts), starts
+
+def find_packed(packed, needle):
+    # Indices of the snippets containing `needle`. Each bytes.find is one C
+    # substring scan over the shared buffer, and a hit skips straight to the
+    # next snippet.
+    import numpy as np
+    buf, starts = packed
+    if not len(starts) or b"\0" in needle:
+        return []
+    hits = []
+    pos = buf.find(needle)
+    while pos != -1:
+        i = int(np.searchsorted(starts, pos, side="right")) - 1
+        hits.append(i)
+        if i + 1 == len(starts):
+            break
+        pos = buf.find(needle, int(starts[i + 1]))
+    return hits
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def get_kb_snippets(files_key):
+    # Read once per KB change and shared rather than copied on every rerun,
+    # alongside the packed lowercased buffer used for substring search
     snippets = []
-    for fname in glob.glob(f"{KB_DIR}/*.txt"):
+    for fname, _ in files_key:
         with open(fname, 'r', encoding='utf-8') as f:
             snippets.append(f.read())
-    return snippets
+    return tuple(snippets), pack_lower(snippets)
 
 def ai_species_id(image_file):
     # MOCKED AI ID (replace with model/API integration if available)
@@ -44,25 +240,169 @@ def ai_species_id(image_file):
         {"species": "Psittacula krameri (Rose-ringed Parakeet)", "confidence": "Low"}
     ]
 
-def simple_rag_query(query, obs_df, kb_snippets):
+def obs_search_text(obs_df, sep=" "):
+    # One searchable document per observation
+    cols = obs_df[OBS_SEARCH_COLUMNS].fillna("").astype(str)
+    return cols["species_name"] + sep + cols["common_name"] + sep + cols["notes"] + sep + cols["location"]
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def get_obs_search_lower(obs_key, _obs_df):
+    # Lowercased composite text per observation as one contiguous Arrow string
+    # array, rebuilt only when the data changes. Fields are newline-separated:
+    # single-line queries cannot match across two fields. Lowercasing stays in
+    # Python, as for the query and the knowledge base: Arrow's utf8_lower folds
+    # final sigma and dotted capital I differently from str.lower.
+    import pyarrow as pa
+    return pa.array([text.lower() for text in obs_search_text(_obs_df, sep="\n")], type=pa.string())
+
+def obs_records(obs_df, rows):
+    # Hits leave retrieval as plain dicts of strings, so rendering touches no
+    # pandas objects (missing values included)
+    return obs_df.iloc[rows].fillna("").to_dict("records")
+
+def simple_rag_query(query, obs_df, kb_snippets, kb_packed, obs_search_lower):
     # Simple keyword search: return matching knowledge base and observations
+    import pyarrow.compute as pc
     query_lower = query.lower()
-    kb_hits = [s for s in kb_snippets if query_lower in s.lower()]
-    obs_hits = []
-    for _, row in obs_df.iterrows():
-        if (
-            query_lower in str(row["species_name"]).lower()
-            or query_lower in str(row["common_name"]).lower()
-            or query_lower in str(row["notes"]).lower()
-            or query_lower in str(row["location"]).lower()
-        ):
-            obs_hits.append(row)
+    kb_hits = [kb_snippets[i] for i in find_packed(kb_packed, query_lower.encode("utf-8"))]
+    if len(obs_search_lower) == 0:
+        return kb_hits, []
+    # One literal scan over the composite column, run by Arrow's C++ kernels
+    # end to end: the bit-packed match mask goes straight to hit positions
+    rows = pc.indices_nonzero(pc.match_substring(obs_search_lower, query_lower))
+    obs_hits = obs_records(obs_df, rows.to_numpy())
     return kb_hits, obs_hits
 
-def get_top_observer(obs_df):
-    if obs_df.empty:
+@st.cache_resource(show_spinner=False, max_entries=1)
+def get_tfidf_index(files_key, obs_key, _kb_snippets, _obs_df):
+    # Fitted once per KB/observations change over KB snippets followed by
+    # observation rows; None when scikit-learn is unavailable
+    try:
+        from sklearn.feature_extraction.text import TfidfVectorizer
+    except ImportError:
+        return None
+    docs = list(_kb_snippets) + obs_search_text(_obs_df).tolist()
+    # The token pattern keeps single-character tokens such as the "5" in "Trail 5"
+    vectorizer = TfidfVectorizer(
+        lowercase=True, ngram_range=(1, 2), stop_words="english", token_pattern=r"(?u)\b\w+\b"
+    )
+    try:
+        matrix = vectorizer.fit_transform(docs)
+    except ValueError:  # empty vocabulary
+        return None
+    # Split once so each half can be scored on its own
+    n_kb = len(_kb_snippets)
+    return vectorizer, matrix[:n_kb], matrix[n_kb:]
+
+def top_k(scores, k):
+    # Indices of the k best positive scores, best first
+    import numpy as np
+    k = min(k, np.count_nonzero(scores > 0))
+    if k == 0:
+        return np.array([], dtype=int)
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.argsort(-scores[top])]
+
+def mmr(candidates, relevance, vectors, k=RAG_TOP_K, lambda_=MMR_LAMBDA):
+    # Maximal Marginal Relevance: greedily trade query relevance against
+    # similarity to what is already picked. `candidates` index rows of the
+    # L2-normalised `vectors` (dense or sparse), best first, with `relevance`
+    # holding their query similarities.
+    import numpy as np
+    if len(candidates) <= 1:
+        return candidates
+    rows = vectors[candidates]
+    pair_sims = rows @ rows.T
+    if hasattr(pair_sims, "toarray"):
+        pair_sims = pair_sims.toarray()
+    selected = [0]
+    remaining = list(range(1, len(candidates)))
+    while remaining and len(selected) < k:
+        redundancy = pair_sims[np.ix_(remaining, selected)].max(axis=1)
+        best = remaining[int(np.argmax(lambda_ * relevance[remaining] - (1 - lambda_) * redundancy))]
+        selected.append(best)
+        remaining.remove(best)
+    return candidates[selected]
+
+def tfidf_rank(query_vec, matrix, k=RAG_TOP_K):
+    # Ranked retrieval over one half of the index: a single sparse mat-vec
+    # scores every row, then MMR thins the best candidates
+    scores = (matrix @ query_vec.T).toarray().ravel()
+    ids = top_k(scores, RAG_CANDIDATES)
+    return mmr(ids, scores[ids], matrix, k)
+
+@st.cache_resource(show_spinner="Loading the semantic search model (first use downloads about 90 MB)...")
+def get_embedding_model():
+    # None unless sentence-transformers is installed and the model can be loaded
+    try:
+        from sentence_transformers import SentenceTransformer
+        return SentenceTransformer(EMBEDDING_MODEL)
+    except (ImportError, OSError):
+        return None
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def get_embedding_index(files_key, _kb_snippets):
+    # Dense inner-product index over normalised KB snippet embeddings
+    try:
+        import faiss
+    except ImportError:
+        return None
+    import numpy as np
+    model = get_embedding_model()
+    if model is None or not _kb_snippets:
+        return None
+    embeddings = model.encode(list(_kb_snippets), normalize_embeddings=True, convert_to_numpy=True)
+    embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+    index = faiss.IndexFlatIP(embeddings.shape[1])
+    index.add(embeddings)
+    return model, index, embeddings
+
+def embedding_kb_query(query, kb_snippets, embedding_index, k=RAG_TOP_K):
+    # Semantic KB retrieval: one GEMV against the flat index
+    import numpy as np
+    model, index, embeddings = embedding_index
+    q = model.encode([query], normalize_embeddings=True, convert_to_numpy=True).astype(np.float32)
+    scores, ids = index.search(q, min(RAG_CANDIDATES, index.ntotal))
+    keep = (ids[0] >= 0) & (scores[0] >= EMBEDDING_MIN_SCORE)
+    return [kb_snippets[i] for i in mmr(ids[0][keep], scores[0][keep], embeddings, k)]
+
+def rag_query(query, obs_df, kb_snippets, kb_packed, obs_key, files_key):
+    # Literal substring matches come first, as they always have. A section with
+    # no literal match (typically a natural-language question) falls back to
+    # ranked retrieval: embeddings for the KB, TF-IDF otherwise.
+    kb_hits, obs_hits = simple_rag_query(
+        query, obs_df, kb_snippets, kb_packed, get_obs_search_lower(obs_key, obs_df)
+    )
+    need_kb, need_obs = not kb_hits, not obs_hits
+    if need_kb:
+        embedding_index = get_embedding_index(files_key, kb_snippets)
+        if embedding_index is not None:
+            kb_hits = embedding_kb_query(query, kb_snippets, embedding_index)
+            need_kb = False
+    if need_kb or need_obs:
+        tfidf_index = get_tfidf_index(files_key, obs_key, kb_snippets, obs_df)
+        if tfidf_index is not None:
+            # Only the halves still missing hits are scored
+            vectorizer, kb_matrix, obs_matrix = tfidf_index
+            query_vec = vectorizer.transform([query])
+            if need_kb:
+                kb_hits = [kb_snippets[i] for i in tfidf_rank(query_vec, kb_matrix)]
+            if need_obs:
+                obs_hits = obs_records(obs_df, tfidf_rank(query_vec, obs_matrix))
+    return kb_hits, obs_hits
+
+def count_observers(obs_df):
+    # Built once per session and bumped by save_observation; only rebuilt when
+    # rows from other sessions have landed in the meantime
+    if st.session_state.get("observer_rows") != len(obs_df):
+        st.session_state.observer_counter = Counter(obs_df['submitted_by'].dropna())
+        st.session_state.observer_rows = len(obs_df)
+    return st.session_state.observer_counter
+
+def get_top_observer(observer_counter):
+    if not observer_counter:
         return "N/A"
-    return obs_df['submitted_by'].value_counts().idxmax()
+    return observer_counter.most_common(1)[0][0]
 
 ##############################
 # --- Streamlit Layout
@@ -74,7 +414,10 @@ st.subheader("AI for Community Biodiversity & Sustainable Insights in Islamabad"
 tabs = st.tabs(["Observation Hub", "AI-powered Q&A", "About"])
 
 # --- TAB 1: Observation Hub
-with tabs[0]:
+# Each interactive tab is a fragment: its widgets rerun only that tab, not the
+# whole script
+@st.fragment
+def observation_hub():
     st.header("1. Community Biodiversity Observation Hub")
 
     st.markdown(
@@ -99,19 +442,23 @@ with tabs[0]:
         submitted = st.form_submit_button("Submit Observation")
 
     if submitted:
+        # One id names both the observation and its image
+        obs_id = uuid.uuid4().hex
         # Save image to local folder (simulate image hosting)
         if image_file:
             img_folder = "data/images"
             os.makedirs(img_folder, exist_ok=True)
-            img_path = os.path.join(img_folder, f"{uuid.uuid4()}.jpg")
+            img_path = os.path.join(img_folder, obs_id + ".jpg")
+            # UploadedFile is already an in-memory BytesIO; copy it out in 64 KiB chunks
+            image_file.seek(0)
             with open(img_path, "wb") as f:
-                f.write(image_file.getbuffer())
+                shutil.copyfileobj(image_file, f, length=1 << 16)
             image_url = img_path
         else:
             image_url = ""
 
         obs_row = {
-            "observation_id": str(uuid.uuid4()),
+            "observation_id": obs_id,
             "species_name": species_name,
             "common_name": common_name,
             "date_observed": str(date_observed),
@@ -134,17 +481,34 @@ with tabs[0]:
 
     # --- Display Observations
     st.markdown("#### Community Observations")
-    obs_df = load_observations()
+    obs_df, _ = session_observations()
+    observer_counter = count_observers(obs_df)
     if obs_df.empty:
         st.info("No observations yet. Submit the first one!")
     else:
         # Gamification: Top observer
-        top_observer = get_top_observer(obs_df)
+        top_observer = get_top_observer(observer_counter)
         st.markdown(f"🏆 *Top Observer:* {top_observer}")
-        st.dataframe(obs_df[["species_name", "common_name", "date_observed", "location", "notes", "submitted_by"]])
+        # Only the newest rows go to the widget, which re-serialises its frame every rerun
+        if len(obs_df) > OBS_DISPLAY_ROWS:
+            st.caption(f"Showing the latest {OBS_DISPLAY_ROWS:,} of {len(obs_df):,} observations.")
+        st.dataframe(
+            obs_df[["species_name", "common_name", "date_observed", "location", "notes", "submitted_by"]]
+            .tail(OBS_DISPLAY_ROWS)
+        )
+        st.download_button(
+            "Download observations (CSV)",
+            data=lambda: obs_df.to_csv(index=False),
+            file_name="observations.csv",
+            mime="text/csv",
+        )
+
+with tabs[0]:
+    observation_hub()
 
 # --- TAB 2: RAG Q&A
-with tabs[1]:
+@st.fragment
+def biodiversity_qa():
     st.header("2. Biodiversity Q&A (AI-powered RAG)")
 
     st.markdown(
@@ -154,9 +518,10 @@ with tabs[1]:
 
     query = st.text_input("Enter your question (e.g., 'What birds are common in Margalla Hills?')")
     if st.button("Ask AI"):
-        obs_df = load_observations()
-        kb_snippets = get_kb_snippets()
-        kb_hits, obs_hits = simple_rag_query(query, obs_df, kb_snippets)
+        obs_df, obs_key = session_observations()
+        files_key = kb_files_key()
+        kb_snippets, kb_packed = get_kb_snippets(files_key)
+        kb_hits, obs_hits = rag_query(query, obs_df, kb_snippets, kb_packed, obs_key, files_key)
 
         st.markdown("##### 🔍 *Relevant Info from Knowledge Base:*")
         if kb_hits:
@@ -167,35 +532,42 @@ with tabs[1]:
 
         st.markdown("##### 🔍 *Relevant Community Observations:*")
         if obs_hits:
-            for row in obs_hits:
-                st.write(
-                    f"- {row['species_name']} ({row['common_name']}) @ {row['location']} on {row['date_observed']} — {row['notes']}"
-                )
+            # One markdown element for the whole list rather than one per hit
+            st.markdown("\n".join(
+                f"- {row['species_name']} ({row['common_name']}) @ {row['location']} on {row['date_observed']} — {row['notes']}"
+                for row in obs_hits
+            ))
         else:
             st.info("No matching observations found.")
 
         # Simulated LLM answer
         st.markdown("##### 🤖 *AI Answer:*")
         if kb_hits or obs_hits:
-            st.success(
-                "Based on available data, here's what we found:\n\n"
-                + "\n".join(["• " + hit.split('\n')[0] for hit in kb_hits])
-                + ("\n" if kb_hits else "")
-                + "\n".join([
-                    f"• {row['species_name']} observed at {row['location']} ({row['date_observed']})"
-                    for row in obs_hits
-                ])
-            )
+            # Built in one pass; split('\n', 1) stops at each snippet's first line
+            buf = io.StringIO()
+            buf.write("Based on available data, here's what we found:\n\n")
+            for hit in kb_hits:
+                buf.write("• ")
+                buf.write(hit.split('\n', 1)[0])
+                buf.write("\n")
+            for row in obs_hits:
+                buf.write(f"• {row['species_name']} observed at {row['location']} ({row['date_observed']})\n")
+            st.success(buf.getvalue())
         else:
             st.write(
                 "Sorry, I could not find relevant information. Try using different keywords or submit new observations!"
             )
 
         st.info(
-            "This Q&A uses simple keyword search for retrieval and a simulated answer. "
-            "For advanced RAG, integrate with free LLM APIs and use embeddings for semantic search."
+            "This Q&A matches your keywords literally first. When nothing matches, it falls back to semantic search "
+            "over the knowledge base (with sentence-transformers and faiss installed) or TF-IDF ranking "
+            "(with scikit-learn installed). The answer itself is simulated. "
+            "For advanced RAG, integrate with free LLM APIs."
         )
 
+with tabs[1]:
+    biodiversity_qa()
+
 # --- TAB 3: About
 with tabs[2]:
     st.header("About BioScout Islamabad MVP")
@@ -205,7 +577,7 @@ with tabs[2]:
 - 🧠 *AI Species ID:* Get instant (mocked) suggestions for your photo.  
 - 🤖 *RAG Q&A:* Ask questions and get answers from a knowledge base + community data.  
 - 🏆 *Gamification:* See top contributors.  
-- 📊 *Open Data:* All data is stored in editable CSV files for transparency and ease of scaling.
+- 📊 *Open Data:* Observations are stored in open Parquet/CSV files and can be downloaded as CSV for transparency and ease of scaling.
 
 *Intended scaling:* Future versions could include real-time AI species identification, richer maps, Urdu/multilingual support, and integrations with conservation partners.
 